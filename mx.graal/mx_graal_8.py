@@ -66,7 +66,7 @@ class GraalJDKDeployedDist(JvmciJDKDeployedDist):
     def _updateGraalPropertiesFile(self, jreLibDir):
         """
         Updates (or creates) 'jreLibDir'/jvmci/graal.properties to set/modify the
-        graal.version property.
+        graal.version property. The file is only rewritten if its content changes.
         """
         version = _suite.release_version()
         graalProperties = join(jreLibDir, 'jvmci', 'graal.properties')
@@ -81,8 +81,7 @@ class GraalJDKDeployedDist(JvmciJDKDeployedDist):
                         content.append('graal.version=' + version)
                     else:
                         content.append(line.rstrip(os.linesep))
-            with open(graalProperties, 'w') as fp:
-                fp.write(os.linesep.join(content))
+            mx.update_file(graalProperties, os.linesep.join(content))
 
 jdkDeployedDists += [
     JvmciJDKDeployedDist('GRAAL_NODEINFO'),
@@ -134,7 +133,7 @@ def microbench(args):
         # find all projects with a direct JMH dependency
         jmhProjects = []
         for p in mx.projects_opt_limit_to_suites():
-            if 'JMH' in [x.name for x in p.deps]:
+            if any(x.name == 'JMH' for x in p.deps):
                 jmhProjects.append(p.name)
         cp = mx.classpath(jmhProjects)
 
@@ -167,6 +166,9 @@ def ctw(args, extraVMarguments=None):
 
     args, vmargs = parser.parse_known_args(args)
 
+    jdk = get_jvmci_jdk()
+    jdk9 = jdk.javaCompliance >= '9'
+
     if args.ctwopts:
         # Replace spaces  with '#' since -G: options cannot contain spaces
         # when they are collated in the "jvmci.options" system property
@@ -175,18 +177,18 @@ def ctw(args, extraVMarguments=None):
     if args.cp:
         cp = os.path.abspath(args.cp)
     else:
-        if get_jvmci_jdk().javaCompliance < '9':
-            cp = join(get_jvmci_jdk().home, 'jre', 'lib', 'rt.jar')
+        if not jdk9:
+            cp = join(jdk.home, 'jre', 'lib', 'rt.jar')
         else:
-            cp = join(get_jvmci_jdk().home, 'modules', 'java.base') + os.pathsep + \
-                 join(get_jvmci_jdk().home, 'lib', 'modules', 'bootmodules.jimage')
+            cp = join(jdk.home, 'modules', 'java.base') + os.pathsep + \
+                 join(jdk.home, 'lib', 'modules', 'bootmodules.jimage')
         vmargs.append('-G:CompileTheWorldExcludeMethodFilter=sun.awt.X11.*.*')
 
     # suppress menubar and dock when running on Mac; exclude x11 classes as they may cause vm crashes (on Solaris)
     vmargs = ['-Djava.awt.headless=true'] + vmargs
 
     vm = get_vm()
-    if get_jvmci_jdk().javaCompliance >= '9':
+    if jdk9:
         jvmciMode = _jvmci_get_vm().jvmciMode
         if jvmciMode == 'disabled':
             vmargs += ['-XX:+CompileTheWorld', '-Xbootclasspath/p:' + cp]
@@ -352,9 +354,9 @@ def jdkartifactstats(args):
 
     jvmLib = join(jdkDir, relativeVmLibDirInJdk(), get_vm(), mx.add_lib_suffix(mx.add_lib_prefix('jvm')))
     print
-    if exists(jvmLib):
+    try:
         print '{:10,}  {}'.format(os.path.getsize(jvmLib), jvmLib)
-    else:
+    except OSError:
         print '{:>10}  {}'.format('<missing>', jvmLib)
 
 mx.update_commands(_suite, {
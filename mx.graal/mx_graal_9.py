@@ -148,7 +148,7 @@ def microbench(args):
         # find all projects with a direct JMH dependency
         jmhProjects = []
         for p in mx.projects_opt_limit_to_suites():
-            if 'JMH' in [x.name for x in p.deps]:
+            if any(x.name == 'JMH' for x in p.deps):
                 jmhProjects.append(p.name)
         cp = mx.classpath(jmhProjects)
 
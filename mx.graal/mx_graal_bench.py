@@ -54,6 +54,7 @@ def _run_benchmark(args, availableBenchmarks, runBenchmark):
     failed = []
     for bm in benchmarks:
         if not runBenchmark(bm, harnessArgs, vmOpts):
+            mx.log('Benchmark failed: ' + bm)
             failed.append(bm)
 
     if len(failed) != 0:
@@ -141,7 +142,7 @@ def bench(args):
     else:
         dacapos = benchmarks_in_group('dacapo')
         for dacapo in dacapos:
-            if dacapo not in sanitycheck.dacapoSanityWarmup.keys():
+            if dacapo not in sanitycheck.dacapoSanityWarmup:
                 mx.abort('Unknown DaCapo : ' + dacapo)
             iterations = sanitycheck.dacapoSanityWarmup[dacapo][sanitycheck.SanityCheckLevel.Benchmark]
             if iterations > 0:
@@ -152,7 +153,7 @@ def bench(args):
     else:
         scaladacapos = benchmarks_in_group('scaladacapo')
         for scaladacapo in scaladacapos:
-            if scaladacapo not in sanitycheck.dacapoScalaSanityWarmup.keys():
+            if scaladacapo not in sanitycheck.dacapoScalaSanityWarmup:
                 mx.abort('Unknown Scala DaCapo : ' + scaladacapo)
             iterations = sanitycheck.dacapoScalaSanityWarmup[scaladacapo][sanitycheck.SanityCheckLevel.Benchmark]
             if iterations > 0:
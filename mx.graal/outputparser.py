@@ -52,20 +52,43 @@ class ValuesMatcher:
         assert isinstance(valuesTemplate, dict)
         self.regex = regex
         self.valuesTemplate = valuesTemplate
+        # The templates are fixed so they are split into literal text and
+        # group names once instead of being re-scanned for every match
+        self.templateParts = [(_split_template(k), _split_template(v)) for k, v in valuesTemplate.items()]
 
     def parse(self, text, valueMaps):
         for match in self.regex.finditer(text):
             valueMap = {}
-            for keyTemplate, valueTemplate in self.valuesTemplate.items():
-                key = self.get_template_value(match, keyTemplate)
-                value = self.get_template_value(match, valueTemplate)
+            for keyParts, valueParts in self.templateParts:
+                key = _expand_template(match, keyParts)
+                value = _expand_template(match, valueParts)
                 assert not valueMap.has_key(key), key
                 valueMap[key] = value
             valueMaps.append(valueMap)
 
     def get_template_value(self, match, template):
-        def replace_var(m):
-            groupName = m.group(1)
-            return match.group(groupName)
+        return _expand_template(match, _split_template(template))
 
-        return re.sub(r'<([\w]+)>', replace_var, template)
+_templateVar = re.compile(r'<([\w]+)>')
+
+def _split_template(template):
+    """
+    Splits a template into a list alternating between literal text (even
+    indexes) and regular expression group names (odd indexes). A constant
+    template is returned as is.
+    """
+    parts = _templateVar.split(template)
+    if len(parts) == 1:
+        return template
+    return parts
+
+def _expand_template(match, parts):
+    if isinstance(parts, basestring):
+        return parts
+    result = []
+    for i, part in enumerate(parts):
+        if i % 2 == 0:
+            result.append(part)
+        else:
+            result.append(match.group(part) or '')
+    return ''.join(result)
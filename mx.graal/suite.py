@@ -30,6 +30,17 @@ def suites(l):
     """ Filters out suites named 'jvmci' if using JDK9. """
     return [s for s in l if not JDK9 or not s.get('name') == "jvmci"]
 
+def project(d):
+    """
+    Adds the attributes shared by (almost) all Graal projects to
+    the project definition 'd' unless it defines them itself.
+    """
+    d.setdefault("subDir", "graal")
+    d.setdefault("sourceDirs", ["src"])
+    d.setdefault("checkstyle", "com.oracle.graal.graph")
+    d.setdefault("javaCompliance", "1.8")
+    return d
+
 suite = {
   "mxversion" : "5.5.14",
   "name" : "graal",
@@ -105,126 +116,82 @@ suite = {
 
     # ------------- NFI -------------
 
-    "com.oracle.nfi" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
-      "checkstyle" : "com.oracle.graal.graph",
+    "com.oracle.nfi" : project({
       "javaCompliance" : "1.7",
-    },
+    }),
 
-    "com.oracle.nfi.test" : {
-      "subDir" : "graal",
+    "com.oracle.nfi.test" : project({
       "sourceDirs" : ["test"],
       "dependencies" : deps([
         "com.oracle.nfi",
         "jvmci:JVMCI_API",
         "mx:JUNIT",
       ]),
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
-    },
+    }),
 
     # ------------- Graal -------------
 
-    "com.oracle.graal.debug" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
-      "checkstyle" : "com.oracle.graal.graph",
+    "com.oracle.graal.debug" : project({
       "dependencies" : deps([
         "jvmci:JVMCI_API",
       ]),
       "annotationProcessors" : deps(["jvmci:JVMCI_OPTIONS_PROCESSOR"]),
-      "javaCompliance" : "1.8",
       "workingSets" : "JVMCI,Debug",
-    },
+    }),
 
-    "com.oracle.graal.debug.test" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.debug.test" : project({
       "dependencies" : [
         "mx:JUNIT",
         "com.oracle.graal.debug",
       ],
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "JVMCI,Debug,Test",
-    },
+    }),
 
-    "com.oracle.graal.code" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.code" : project({
       "dependencies" : deps([
         "jvmci:JVMCI_SERVICE",
         "jvmci:JVMCI_API",
       ]),
       "annotationProcessors" : deps(["jvmci:JVMCI_SERVICE_PROCESSOR"]),
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal",
-    },
+    }),
 
-    "com.oracle.graal.api.collections" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
+    "com.oracle.graal.api.collections" : project({
       "workingSets" : "API,Graal",
-    },
+    }),
 
-    "com.oracle.graal.api.directives" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
+    "com.oracle.graal.api.directives" : project({
       "workingSets" : "API,Graal",
-    },
+    }),
 
-    "com.oracle.graal.api.directives.test" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
-      "checkstyle" : "com.oracle.graal.graph",
+    "com.oracle.graal.api.directives.test" : project({
       "dependencies" : [
         "com.oracle.graal.compiler.test",
       ],
-      "javaCompliance" : "1.8",
       "workingSets" : "API,Graal",
-    },
+    }),
 
-    "com.oracle.graal.api.runtime" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.api.runtime" : project({
       "dependencies" : deps([
         "jvmci:JVMCI_API",
       ]),
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "API,Graal",
-    },
+    }),
 
-    "com.oracle.graal.api.test" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.api.test" : project({
       "dependencies" : [
         "mx:JUNIT",
         "com.oracle.graal.api.runtime",
       ],
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "API,Graal,Test",
-    },
+    }),
 
-    "com.oracle.graal.api.replacements" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.api.replacements" : project({
       "dependencies" : deps(["jvmci:JVMCI_API"]),
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "API,Graal,Replacements",
-    },
+    }),
 
-    "com.oracle.graal.hotspot" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.hotspot" : project({
       "dependencies" : deps([
         "jvmci:JVMCI_HOTSPOT",
         "com.oracle.graal.api.runtime",
@@ -232,7 +199,6 @@ suite = {
         "com.oracle.graal.runtime",
         "com.oracle.graal.code",
       ]),
-      "checkstyle" : "com.oracle.graal.graph",
       "annotationProcessors" : deps([
         "GRAAL_NODEINFO_PROCESSOR",
         "GRAAL_COMPILER_MATCH_PROCESSOR",
@@ -240,85 +206,60 @@ suite = {
         "jvmci:JVMCI_OPTIONS_PROCESSOR",
         "jvmci:JVMCI_SERVICE_PROCESSOR",
       ]),
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,HotSpot",
-    },
+    }),
 
-    "com.oracle.graal.hotspot.amd64" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.hotspot.amd64" : project({
       "dependencies" : [
         "com.oracle.graal.compiler.amd64",
         "com.oracle.graal.hotspot",
         "com.oracle.graal.replacements.amd64",
       ],
-      "checkstyle" : "com.oracle.graal.graph",
       "annotationProcessors" : deps([
         "jvmci:JVMCI_SERVICE_PROCESSOR",
         "GRAAL_NODEINFO_PROCESSOR"
       ]),
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,HotSpot,AMD64",
-    },
+    }),
 
-    "com.oracle.graal.hotspot.sparc" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.hotspot.sparc" : project({
       "dependencies" : [
         "com.oracle.graal.hotspot",
         "com.oracle.graal.compiler.sparc",
         "com.oracle.graal.replacements.sparc",
       ],
-      "checkstyle" : "com.oracle.graal.graph",
       "annotationProcessors" : deps(["jvmci:JVMCI_SERVICE_PROCESSOR"]),
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,HotSpot,SPARC",
-    },
+    }),
 
-    "com.oracle.graal.hotspot.test" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.hotspot.test" : project({
       "dependencies" : [
         "com.oracle.graal.replacements.test",
         "com.oracle.graal.hotspot",
       ],
       "annotationProcessors" : ["GRAAL_NODEINFO_PROCESSOR"],
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,HotSpot,Test",
-    },
+    }),
 
-    "com.oracle.graal.hotspot.amd64.test" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.hotspot.amd64.test" : project({
       "dependencies" : [
         "com.oracle.graal.asm.amd64",
         "com.oracle.graal.hotspot.test",
       ],
       "annotationProcessors" : ["GRAAL_NODEINFO_PROCESSOR"],
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,HotSpot,AMD64,Test",
-    },
+    }),
 
-    "com.oracle.graal.nodeinfo" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
+    "com.oracle.graal.nodeinfo" : project({
       "workingSets" : "Graal,Graph",
-    },
+    }),
 
-    "com.oracle.graal.nodeinfo.processor" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
-      "checkstyle" : "com.oracle.graal.graph",
+    "com.oracle.graal.nodeinfo.processor" : project({
       "dependencies" : [
         "com.oracle.graal.nodeinfo",
       ],
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,Graph",
-    },
+    }),
 
     "com.oracle.graal.graph" : {
       "subDir" : "graal",
@@ -336,270 +277,184 @@ suite = {
       "workingSets" : "Graal,Graph",
     },
 
-    "com.oracle.graal.graph.test" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
-      "checkstyle" : "com.oracle.graal.graph",
+    "com.oracle.graal.graph.test" : project({
       "dependencies" : [
         "mx:JUNIT",
         "com.oracle.graal.api.test",
         "com.oracle.graal.graph",
       ],
       "annotationProcessors" : ["GRAAL_NODEINFO_PROCESSOR"],
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,Graph,Test",
-    },
+    }),
 
-    "com.oracle.graal.asm" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.asm" : project({
       "dependencies" : deps(["jvmci:JVMCI_API"]),
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,Assembler",
-    },
+    }),
 
-    "com.oracle.graal.asm.amd64" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.asm.amd64" : project({
       "dependencies" : [
         "com.oracle.graal.asm",
       ],
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,Assembler,AMD64",
-    },
+    }),
 
-    "com.oracle.graal.asm.sparc" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.asm.sparc" : project({
       "dependencies" : [
         "com.oracle.graal.asm",
       ],
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,Assembler,SPARC",
-    },
+    }),
 
-    "com.oracle.graal.bytecode" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
+    "com.oracle.graal.bytecode" : project({
       "workingSets" : "Graal,Java",
-    },
+    }),
 
-    "com.oracle.graal.asm.test" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.asm.test" : project({
       "dependencies" : [
         "com.oracle.graal.code",
         "com.oracle.graal.test",
         "com.oracle.graal.debug",
       ],
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,Assembler,Test",
-    },
+    }),
 
-    "com.oracle.graal.asm.amd64.test" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.asm.amd64.test" : project({
       "dependencies" : [
         "com.oracle.graal.asm.test",
         "com.oracle.graal.asm.amd64",
       ],
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,Assembler,AMD64,Test",
-    },
+    }),
 
-    "com.oracle.graal.lir" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.lir" : project({
       "dependencies" : [
         "com.oracle.graal.compiler.common",
         "com.oracle.graal.asm",
       ],
       "annotationProcessors" : deps(["jvmci:JVMCI_OPTIONS_PROCESSOR"]),
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,LIR",
-    },
+    }),
 
-    "com.oracle.graal.lir.jtt" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.lir.jtt" : project({
       "dependencies" : [
         "com.oracle.graal.jtt",
       ],
       "annotationProcessors" : ["GRAAL_NODEINFO_PROCESSOR"],
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,LIR",
       "findbugs" : "false",
-    },
+    }),
 
-    "com.oracle.graal.lir.test" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.lir.test" : project({
       "dependencies" : [
         "mx:JUNIT",
         "com.oracle.graal.lir",
       ],
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,LIR",
-    },
+    }),
 
-    "com.oracle.graal.lir.amd64" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.lir.amd64" : project({
       "dependencies" : [
         "com.oracle.graal.lir",
         "com.oracle.graal.asm.amd64",
       ],
       "annotationProcessors" : deps(["jvmci:JVMCI_OPTIONS_PROCESSOR"]),
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,LIR,AMD64",
-    },
+    }),
 
-    "com.oracle.graal.lir.sparc" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.lir.sparc" : project({
       "dependencies" : [
         "com.oracle.graal.asm.sparc",
         "com.oracle.graal.lir",
       ],
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,LIR,SPARC",
-    },
+    }),
 
-    "com.oracle.graal.word" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.word" : project({
       "dependencies" : ["com.oracle.graal.nodes"],
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "annotationProcessors" : ["GRAAL_NODEINFO_PROCESSOR"],
       "workingSets" : "API,Graal",
-    },
+    }),
 
-    "com.oracle.graal.replacements" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.replacements" : project({
       "dependencies" : [
         "com.oracle.graal.api.directives",
         "com.oracle.graal.java",
         "com.oracle.graal.loop.phases",
         "com.oracle.graal.word",
       ],
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "annotationProcessors" : deps([
         "jvmci:JVMCI_OPTIONS_PROCESSOR",
         "GRAAL_REPLACEMENTS_VERIFIER",
         "GRAAL_NODEINFO_PROCESSOR",
       ]),
       "workingSets" : "Graal,Replacements",
-    },
+    }),
 
-    "com.oracle.graal.replacements.amd64" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.replacements.amd64" : project({
       "dependencies" : [
           "com.oracle.graal.replacements",
           "com.oracle.graal.lir.amd64",
           "com.oracle.graal.compiler",
           ],
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "annotationProcessors" : [
         "GRAAL_NODEINFO_PROCESSOR",
       ],
       "workingSets" : "Graal,Replacements,AMD64",
-    },
+    }),
 
-    "com.oracle.graal.replacements.sparc" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.replacements.sparc" : project({
       "dependencies" : [
           "com.oracle.graal.replacements",
           "com.oracle.graal.compiler",
           ],
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,Replacements,SPARC",
-    },
+    }),
 
-    "com.oracle.graal.replacements.test" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.replacements.test" : project({
       "dependencies" : [
         "com.oracle.graal.compiler.test",
         "com.oracle.graal.replacements",
       ],
       "annotationProcessors" : ["GRAAL_NODEINFO_PROCESSOR"],
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,Replacements,Test",
       "jacoco" : "exclude",
-    },
+    }),
 
-    "com.oracle.graal.replacements.verifier" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.replacements.verifier" : project({
       "dependencies" : [
         "com.oracle.graal.api.replacements",
         "com.oracle.graal.graph",
       ],
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,Replacements",
-    },
+    }),
 
-    "com.oracle.graal.nodes" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.nodes" : project({
       "dependencies" : [
         "com.oracle.graal.graph",
         "com.oracle.graal.api.replacements",
         "com.oracle.graal.lir",
         "com.oracle.graal.bytecode",
       ],
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "annotationProcessors" : [
         "GRAAL_NODEINFO_PROCESSOR",
         "GRAAL_REPLACEMENTS_VERIFIER",
       ],
       "workingSets" : "Graal,Graph",
-    },
+    }),
 
-    "com.oracle.graal.nodes.test" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.nodes.test" : project({
       "dependencies" : ["com.oracle.graal.compiler.test"],
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,Graph",
-    },
+    }),
 
-    "com.oracle.graal.phases" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.phases" : project({
       "dependencies" : ["com.oracle.graal.nodes"],
       "annotationProcessors" : deps(["jvmci:JVMCI_OPTIONS_PROCESSOR"]),
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,Phases",
-    },
+    }),
 
-    "com.oracle.graal.phases.common" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.phases.common" : project({
       "dependencies" : ["com.oracle.graal.phases",
 						"uk.ac.ed.marawacc.compilation",
 					    ],
@@ -607,219 +462,151 @@ suite = {
         "GRAAL_NODEINFO_PROCESSOR",
         "jvmci:JVMCI_OPTIONS_PROCESSOR"
       ]),
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,Phases",
-    },
+    }),
 
-    "com.oracle.graal.phases.common.test" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.phases.common.test" : project({
       "dependencies" : [
         "com.oracle.graal.api.test",
         "com.oracle.graal.runtime",
         "mx:JUNIT",
       ],
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,Test",
-    },
+    }),
 
-    "com.oracle.graal.virtual" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.virtual" : project({
       "dependencies" : ["com.oracle.graal.phases.common"],
       "annotationProcessors" : deps([
         "jvmci:JVMCI_OPTIONS_PROCESSOR",
         "GRAAL_NODEINFO_PROCESSOR"
       ]),
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,Phases",
-    },
+    }),
 
-    "com.oracle.graal.virtual.bench" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.virtual.bench" : project({
       "dependencies" : ["JMH", "com.oracle.graal.microbenchmarks"],
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "annotationProcessors" : ["JMH"],
       "workingSets" : "Graal,Bench",
-    },
+    }),
 
-    "com.oracle.graal.microbenchmarks" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.microbenchmarks" : project({
       "dependencies" : [
         "JMH",
         "com.oracle.graal.api.test",
         "com.oracle.graal.java",
         "com.oracle.graal.runtime",
       ],
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "annotationProcessors" : ["JMH"],
       "workingSets" : "Graal,Bench",
-    },
+    }),
 
-    "com.oracle.graal.loop" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.loop" : project({
       "dependencies" : ["com.oracle.graal.nodes"],
       "annotationProcessors" : deps(["jvmci:JVMCI_OPTIONS_PROCESSOR"]),
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal",
-    },
+    }),
 
-    "com.oracle.graal.loop.phases" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.loop.phases" : project({
       "dependencies" : [
 	 "com.oracle.graal.loop",
 	 "com.oracle.graal.phases.common",
        ],
       "annotationProcessors" : deps(["jvmci:JVMCI_OPTIONS_PROCESSOR"]),
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,Phases",
-    },
+    }),
 
-    "com.oracle.graal.compiler" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.compiler" : project({
       "dependencies" : [
         "com.oracle.graal.virtual",
         "com.oracle.graal.loop.phases",
       ],
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "annotationProcessors" : deps([
         "jvmci:JVMCI_SERVICE_PROCESSOR",
         "jvmci:JVMCI_OPTIONS_PROCESSOR",
       ]),
       "workingSets" : "Graal",
-    },
+    }),
 
-    "com.oracle.graal.compiler.match.processor" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.compiler.match.processor" : project({
       "dependencies" : [
         "com.oracle.graal.compiler",
       ],
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,Codegen",
-    },
+    }),
 
-    "com.oracle.graal.compiler.amd64" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.compiler.amd64" : project({
       "dependencies" : [
         "com.oracle.graal.compiler",
         "com.oracle.graal.lir.amd64",
         "com.oracle.graal.java",
       ],
-      "checkstyle" : "com.oracle.graal.graph",
       "annotationProcessors" : deps([
         "GRAAL_NODEINFO_PROCESSOR",
         "GRAAL_COMPILER_MATCH_PROCESSOR",
       ]),
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,AMD64",
-    },
+    }),
 
-    "com.oracle.graal.compiler.amd64.test" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.compiler.amd64.test" : project({
       "dependencies" : deps([
         "com.oracle.graal.lir.jtt",
         "com.oracle.graal.lir.amd64",
         "jvmci:JVMCI_HOTSPOT"
       ]),
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,AMD64,Test",
-    },
+    }),
 
-    "com.oracle.graal.compiler.sparc" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.compiler.sparc" : project({
       "dependencies" : [
         "com.oracle.graal.compiler",
         "com.oracle.graal.lir.sparc",
         "com.oracle.graal.java"
       ],
-      "checkstyle" : "com.oracle.graal.graph",
       "annotationProcessors" : deps([
         "GRAAL_NODEINFO_PROCESSOR",
         "GRAAL_COMPILER_MATCH_PROCESSOR",
       ]),
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,SPARC",
-    },
+    }),
 
-    "com.oracle.graal.compiler.sparc.test" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.compiler.sparc.test" : project({
       "dependencies" : deps([
         "com.oracle.graal.lir.jtt",
         "jvmci:JVMCI_HOTSPOT"
       ]),
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,SPARC,Test",
-    },
+    }),
 
-    "com.oracle.graal.runtime" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.runtime" : project({
       "dependencies" : ["com.oracle.graal.compiler"],
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal",
-    },
+    }),
 
-    "com.oracle.graal.java" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.java" : project({
       "dependencies" : [
         "com.oracle.graal.phases",
         "com.oracle.graal.graphbuilderconf",
       ],
       "annotationProcessors" : deps(["jvmci:JVMCI_OPTIONS_PROCESSOR"]),
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,Java",
-    },
+    }),
 
-    "com.oracle.graal.graphbuilderconf" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.graphbuilderconf" : project({
       "dependencies" : [
         "com.oracle.graal.nodes",
       ],
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,Java",
-    },
+    }),
 
-    "com.oracle.graal.compiler.common" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.compiler.common" : project({
       "dependencies" : [
         "com.oracle.graal.debug",
       ],
       "annotationProcessors" : deps(["jvmci:JVMCI_OPTIONS_PROCESSOR"]),
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,Java",
-    },
+    }),
 
-    "com.oracle.graal.printer" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.printer" : project({
       "dependencies" : [
         "com.oracle.graal.code",
         "com.oracle.graal.java",
@@ -829,25 +616,17 @@ suite = {
         "jvmci:JVMCI_OPTIONS_PROCESSOR",
         "jvmci:JVMCI_SERVICE_PROCESSOR"
       ]),
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,Graph",
-    },
+    }),
 
-    "com.oracle.graal.test" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.test" : project({
       "dependencies" : [
         "mx:JUNIT",
       ],
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,Test",
-    },
+    }),
 
-    "com.oracle.graal.compiler.test" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.compiler.test" : project({
       "dependencies" : [
         "com.oracle.graal.api.directives",
         "com.oracle.graal.java",
@@ -857,30 +636,22 @@ suite = {
         "JAVA_ALLOCATION_INSTRUMENTER",
       ],
       "annotationProcessors" : ["GRAAL_NODEINFO_PROCESSOR"],
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,Test",
       "jacoco" : "exclude",
-    },
+    }),
 
-    "com.oracle.graal.jtt" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.jtt" : project({
       "dependencies" : [
         "com.oracle.graal.compiler.test",
       ],
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,Test",
       "jacoco" : "exclude",
       "findbugs" : "false",
-    },
+    }),
 
     # ------------- GraalTruffle -------------
 
-    "com.oracle.graal.truffle" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.truffle" : project({
       "dependencies" : [
         "truffle:TRUFFLE_API",
         "com.oracle.graal.api.runtime",
@@ -889,7 +660,6 @@ suite = {
 	"com.oracle.graal.printer",
 	"uk.ac.ed.marawacc.graal",
       ],
-      "checkstyle" : "com.oracle.graal.graph",
       "annotationProcessors" : deps([
         "GRAAL_NODEINFO_PROCESSOR",
         "GRAAL_REPLACEMENTS_VERIFIER",
@@ -897,14 +667,11 @@ suite = {
         "jvmci:JVMCI_SERVICE_PROCESSOR",
         "truffle:TRUFFLE_DSL_PROCESSOR",
       ]),
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,Truffle",
       "jacoco" : "exclude",
-    },
+    }),
 
-    "com.oracle.graal.truffle.test" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.truffle.test" : project({
       "dependencies" : [
         "com.oracle.graal.truffle",
         "com.oracle.graal.compiler.test",
@@ -914,72 +681,52 @@ suite = {
         "GRAAL_NODEINFO_PROCESSOR",
         "truffle:TRUFFLE_DSL_PROCESSOR"
       ],
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,Truffle,Test",
       "jacoco" : "exclude",
-    },
+    }),
 
-    "com.oracle.graal.truffle.hotspot" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.truffle.hotspot" : project({
       "dependencies" : [
         "com.oracle.graal.truffle",
         "com.oracle.graal.hotspot",
         "com.oracle.nfi",
       ],
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "annotationProcessors" : deps([
         "jvmci:JVMCI_OPTIONS_PROCESSOR",
         "jvmci:JVMCI_SERVICE_PROCESSOR"
       ]),
       "workingSets" : "Graal,Truffle",
-    },
+    }),
 
-    "com.oracle.graal.truffle.hotspot.amd64" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.truffle.hotspot.amd64" : project({
       "dependencies" : [
         "com.oracle.graal.truffle.hotspot",
         "com.oracle.graal.hotspot.amd64",
       ],
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "annotationProcessors" : deps([
         "jvmci:JVMCI_SERVICE_PROCESSOR",
       ]),
       "workingSets" : "Graal,Truffle",
-    },
+    }),
 
-    "com.oracle.graal.truffle.hotspot.sparc" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.truffle.hotspot.sparc" : project({
       "dependencies" : [
         "com.oracle.graal.truffle.hotspot",
         "com.oracle.graal.asm.sparc",
       ],
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "annotationProcessors" : deps(["jvmci:JVMCI_SERVICE_PROCESSOR"]),
       "workingSets" : "Graal,Truffle,SPARC",
-    },
+    }),
 
     # New Graal-Truffle-GPU package for GPU compilation
-    "uk.ac.ed.marawacc.compilation" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "uk.ac.ed.marawacc.compilation" : project({
       "dependencies" : [
         "com.oracle.graal.phases",
       ],
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,Truffle",
-    },
+    }),
 
-    "uk.ac.ed.marawacc.graal" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "uk.ac.ed.marawacc.graal" : project({
       "dependencies" : [
         "com.oracle.graal.compiler",
         "com.oracle.graal.runtime",
@@ -988,17 +735,13 @@ suite = {
         "com.oracle.graal.printer",
         "com.oracle.graal.api.runtime",
       ],
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal,Truffle",
-    },
+    }),
 
 
     # ------------- Salver -------------
 
-    "com.oracle.graal.salver" : {
-      "subDir" : "graal",
-      "sourceDirs" : ["src"],
+    "com.oracle.graal.salver" : project({
       "dependencies" : [
         "com.oracle.graal.java",
       ],
@@ -1006,10 +749,8 @@ suite = {
         "jvmci:JVMCI_OPTIONS_PROCESSOR",
         "jvmci:JVMCI_SERVICE_PROCESSOR",
       ]),
-      "checkstyle" : "com.oracle.graal.graph",
-      "javaCompliance" : "1.8",
       "workingSets" : "Graal",
-    },
+    }),
   },
 
   "distributions" : {